@@ -4,14 +4,60 @@ Configuration management for OpenStudio MCP Server.
 Handles paths, environment variables, and server settings.
 """
 
+import atexit
+import functools
 import os
 import logging
+import queue
 from dataclasses import dataclass, field
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 import platform
 
 
+@functools.lru_cache(maxsize=4)
+def _detect_openstudio_installation(version: str, env_path: Optional[str], system: str) -> str:
+    """Detect OpenStudio installation directory.
+
+    Pure function of its arguments so results are memoized: the os.path.exists
+    probes only run once per (version, env var, platform) combination even if
+    Config is instantiated many times (tests, subprocess imports).
+    """
+    # Check environment variable first
+    if env_path and os.path.exists(env_path):
+        return env_path
+
+    # Platform-specific default paths
+    possible_paths = []
+
+    if system == "Linux":
+        possible_paths = [
+            f"/usr/local/openstudio-{version}",
+            "/usr/local/openstudio",
+            "/app/software/OpenStudio",  # Docker container path
+        ]
+    elif system == "Darwin":  # macOS
+        possible_paths = [
+            f"/Applications/OpenStudio-{version}",
+            "/Applications/OpenStudio",
+        ]
+    elif system == "Windows":
+        possible_paths = [
+            f"C:\\openstudio-{version}",
+            "C:\\openstudio",
+            f"C:\\Program Files\\OpenStudio-{version}",
+        ]
+
+    # Return first existing path
+    for path in possible_paths:
+        if os.path.exists(path):
+            return path
+
+    # Default fallback
+    return f"/usr/local/openstudio-{version}"
+
+
 @dataclass
 class OpenStudioConfig:
     """OpenStudio installation and configuration settings."""
@@ -26,48 +72,13 @@ class OpenStudioConfig:
     def __post_init__(self):
         """Auto-detect OpenStudio installation if not specified."""
         if not self.installation_dir:
-            self.installation_dir = self._detect_openstudio_installation()
+            self.installation_dir = _detect_openstudio_installation(
+                self.version, os.getenv("OPENSTUDIO_PATH"), platform.system()
+            )
 
         if not self.sdk_path and self.installation_dir:
             self.sdk_path = os.path.join(self.installation_dir, "lib")
 
-    def _detect_openstudio_installation(self) -> str:
-        """Detect OpenStudio installation directory."""
-        # Check environment variable first
-        env_path = os.getenv("OPENSTUDIO_PATH")
-        if env_path and os.path.exists(env_path):
-            return env_path
-
-        # Platform-specific default paths
-        system = platform.system()
-        possible_paths = []
-
-        if system == "Linux":
-            possible_paths = [
-                f"/usr/local/openstudio-{self.version}",
-                "/usr/local/openstudio",
-                "/app/software/OpenStudio",  # Docker container path
-            ]
-        elif system == "Darwin":  # macOS
-            possible_paths = [
-                f"/Applications/OpenStudio-{self.version}",
-                "/Applications/OpenStudio",
-            ]
-        elif system == "Windows":
-            possible_paths = [
-                f"C:\\openstudio-{self.version}",
-                "C:\\openstudio",
-                f"C:\\Program Files\\OpenStudio-{self.version}",
-            ]
-
-        # Return first existing path
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-
-        # Default fallback
-        return f"/usr/local/openstudio-{self.version}"
-
 
 @dataclass
 class PathConfig:
@@ -121,40 +132,48 @@ def setup_logging(config: Config) -> None:
         # Can't create logs directory in Docker, just log to console
         pass
 
-    # Prepare handlers - start with console
-    handlers = [logging.StreamHandler()]  # Console output always available
+    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-    # Try to add file handlers if we have write permission
+    # Try to create file handlers if we have write permission
+    file_handlers = []
     try:
         main_log_file = os.path.join(logs_dir, "openstudio_mcp_server.log")
-        handlers.append(logging.FileHandler(main_log_file))
+        main_handler = logging.FileHandler(main_log_file)
+        main_handler.setFormatter(logging.Formatter(log_format))
+        file_handlers.append(main_handler)
     except (PermissionError, OSError):
         # Can't write log files, console only
         pass
 
-    # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=handlers,
-    )
-
-    # Try to add error log handler if we have write permission
     try:
         error_log_file = os.path.join(logs_dir, "openstudio_mcp_errors.log")
         error_handler = logging.FileHandler(error_log_file)
         error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        )
-        logging.getLogger().addHandler(error_handler)
+        error_handler.setFormatter(logging.Formatter(log_format))
+        file_handlers.append(error_handler)
     except (PermissionError, OSError):
         # Can't write error log file, skip it
         pass
 
+    # Configure root logger with console output (always available)
+    logging.basicConfig(
+        level=log_level,
+        format=log_format,
+        handlers=[logging.StreamHandler()],
+    )
+
+    if file_handlers:
+        # File handlers sit behind a queue drained by a background thread,
+        # so log calls on the request path never block on disk writes
+        log_queue = queue.Queue(-1)
+        logging.getLogger().addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, *file_handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
     logger = logging.getLogger(__name__)
     logger.info(f"Logging initialized at {log_level} level")
-    if handlers and len(handlers) > 1:
+    if file_handlers:
         logger.info(f"Logging to console and files in {logs_dir}")
     else:
         logger.info(f"Logging to console only")
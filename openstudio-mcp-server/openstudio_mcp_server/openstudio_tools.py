@@ -7,6 +7,8 @@ interacting with OpenStudio models through the OpenStudio-Toolkit.
 
 import logging
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import os
@@ -47,8 +49,25 @@ class OpenStudioManager:
         self.config = config
         self.current_model = None
         self.current_file_path = None
+        # Cheap loaded flag for the hot status tool: reading one bool avoids
+        # touching the (large) model object on every status poll
+        self.model_loaded = False
         self.logger = logging.getLogger(__name__)
 
+        # Deserialize-once model cache: parsed models keyed by
+        # (path, mtime_ns, size, translate_version). Any change to the file
+        # on disk changes the key, so reloads always see fresh content
+        # (Bug 2 guarantee). Cached entries are pristine copies: callers get
+        # a clone, so in-place mutations can never leak into the cache.
+        self._model_cache = OrderedDict()
+        self._model_cache_size = int(os.environ.get("OSMCP_MODEL_CACHE_SIZE", "4"))
+
+        # Tool calls now run on worker threads (asyncio.to_thread in
+        # server.py); this lock keeps current_model/current_file_path updates
+        # atomic across concurrent load/save/wizard calls. Reentrant because
+        # the wizard calls save_osm_file while already holding it.
+        self._state_lock = threading.RLock()
+
         self.logger.info("OpenStudioManager initialized")
         self.logger.info(
             f"OpenStudio installation: {config.openstudio.installation_dir}")
@@ -72,58 +91,81 @@ class OpenStudioManager:
             FileNotFoundError: If the file doesn't exist
             ValueError: If the file cannot be loaded
         """
-        try:
-            # Resolve file path using intelligent path resolution (NO CACHE - dynamic search)
-            resolved_path = resolve_osm_path(self.config, file_path)
-
-            # Verify file exists and log file info for debugging
-            if not os.path.exists(resolved_path):
-                raise FileNotFoundError(
-                    f"OSM file not found after resolution: {resolved_path}")
-
-            file_size = os.path.getsize(resolved_path)
-            file_mtime = os.path.getmtime(resolved_path)
-            self.logger.info(
-                f"Loading OSM file: {resolved_path} ({file_size} bytes, modified: {file_mtime})")
-
-            # Import toolkit function
-            from openstudio_toolkit.utils.osm_utils import load_osm_file_as_model
-
-            # Load the model - ALWAYS reads from disk (no cache)
-            model = load_osm_file_as_model(
-                osm_file_path=resolved_path,
-                version_translator=translate_version
-            )
-
-            if model is None:
-                raise ValueError(f"Failed to load OSM file: {resolved_path}")
-
-            # Update state with NEW model (replaces any previous model)
-            self.current_model = model
-            self.current_file_path = resolved_path
-
-            self.logger.info(
-                f"Model loaded successfully from: {resolved_path}")
-
-            # Get building info
-            building_info = self._get_building_summary()
-
-            self.logger.info(
-                f"Successfully loaded model: {building_info.get('name', 'Unnamed')}")
-
-            return {
-                "status": "success",
-                "message": f"Successfully loaded OSM file: {os.path.basename(resolved_path)}",
-                "file_path": resolved_path,
-                "model_info": building_info,
-            }
-
-        except FileNotFoundError as e:
-            self.logger.error(f"File not found: {e}")
-            raise
-        except Exception as e:
-            self.logger.error(f"Error loading OSM file: {e}")
-            raise ValueError(f"Failed to load OSM file: {str(e)}")
+        with self._state_lock:
+            try:
+                # Resolve file path using intelligent path resolution (NO CACHE - dynamic search)
+                resolved_path = resolve_osm_path(self.config, file_path)
+
+                # Verify file exists and log file info for debugging
+                if not os.path.exists(resolved_path):
+                    raise FileNotFoundError(
+                        f"OSM file not found after resolution: {resolved_path}")
+
+                file_stat = os.stat(resolved_path)
+                file_size = file_stat.st_size
+                file_mtime = file_stat.st_mtime
+                self.logger.info(
+                    f"Loading OSM file: {resolved_path} ({file_size} bytes, modified: {file_mtime})")
+
+                # Reuse an already-parsed model if the file is byte-for-byte the
+                # same one (path + mtime_ns + size); a modified file misses and
+                # is re-read from disk, so stale content can never be served
+                cache_key = (resolved_path, file_stat.st_mtime_ns,
+                             file_size, translate_version)
+                cached = self._model_cache.get(cache_key)
+                if cached is not None:
+                    self._model_cache.move_to_end(cache_key)
+                    self.logger.info(f"Model cache hit: {resolved_path}")
+                else:
+                    # Import toolkit function
+                    from openstudio_toolkit.utils.osm_utils import load_osm_file_as_model
+
+                    # Load the model - reads from disk
+                    model = load_osm_file_as_model(
+                        osm_file_path=resolved_path,
+                        version_translator=translate_version
+                    )
+
+                    if model is None:
+                        raise ValueError(f"Failed to load OSM file: {resolved_path}")
+
+                    self._model_cache[cache_key] = model
+                    while len(self._model_cache) > self._model_cache_size:
+                        self._model_cache.popitem(last=False)
+                    cached = model
+
+                # Hand out a deep copy and keep the cached model pristine, so
+                # a mutating path that forgets to invalidate the cache can
+                # never cause a stale/mutated model to be served as fresh
+                model = cached.clone(True).to_Model()
+
+                # Update state with NEW model (replaces any previous model)
+                self.current_model = model
+                self.current_file_path = resolved_path
+                self.model_loaded = True
+
+                self.logger.info(
+                    f"Model loaded successfully from: {resolved_path}")
+
+                # Get building info
+                building_info = self._get_building_summary()
+
+                self.logger.info(
+                    f"Successfully loaded model: {building_info.get('name', 'Unnamed')}")
+
+                return {
+                    "status": "success",
+                    "message": f"Successfully loaded OSM file: {os.path.basename(resolved_path)}",
+                    "file_path": resolved_path,
+                    "model_info": building_info,
+                }
+
+            except FileNotFoundError as e:
+                self.logger.error(f"File not found: {e}")
+                raise
+            except Exception as e:
+                self.logger.error(f"Error loading OSM file: {e}")
+                raise ValueError(f"Failed to load OSM file: {str(e)}")
 
     def save_osm_file(self, file_path: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -138,45 +180,46 @@ class OpenStudioManager:
         Raises:
             ValueError: If no model is loaded or save fails
         """
-        try:
-            if self.current_model is None:
-                raise ValueError("No model loaded. Load a model first.")
+        with self._state_lock:
+            try:
+                if self.current_model is None:
+                    raise ValueError("No model loaded. Load a model first.")
+
+                # Determine save path
+                if file_path is None:
+                    if self.current_file_path is None:
+                        raise ValueError(
+                            "No file path specified and no current file path")
+                    save_path = self.current_file_path
+                else:
+                    save_path = resolve_output_path(
+                        self.config, file_path, file_types=['.osm'])
 
-            # Determine save path
-            if file_path is None:
-                if self.current_file_path is None:
-                    raise ValueError(
-                        "No file path specified and no current file path")
-                save_path = self.current_file_path
-            else:
-                save_path = resolve_output_path(
-                    self.config, file_path, file_types=['.osm'])
+                self.logger.info(f"Saving OSM file: {save_path}")
 
-            self.logger.info(f"Saving OSM file: {save_path}")
+                # Import toolkit function
+                from openstudio_toolkit.utils.osm_utils import save_model_as_osm_file
 
-            # Import toolkit function
-            from openstudio_toolkit.utils.osm_utils import save_model_as_osm_file
+                # Save the model
+                save_model_as_osm_file(
+                    osm_model=self.current_model,
+                    osm_file_path=save_path
+                )
 
-            # Save the model
-            save_model_as_osm_file(
-                osm_model=self.current_model,
-                osm_file_path=save_path
-            )
+                # Update current path
+                self.current_file_path = save_path
 
-            # Update current path
-            self.current_file_path = save_path
+                self.logger.info(f"Successfully saved model to: {save_path}")
 
-            self.logger.info(f"Successfully saved model to: {save_path}")
+                return {
+                    "status": "success",
+                    "message": f"Successfully saved OSM file: {os.path.basename(save_path)}",
+                    "file_path": save_path,
+                }
 
-            return {
-                "status": "success",
-                "message": f"Successfully saved OSM file: {os.path.basename(save_path)}",
-                "file_path": save_path,
-            }
-
-        except Exception as e:
-            self.logger.error(f"Error saving OSM file: {e}")
-            raise ValueError(f"Failed to save OSM file: {str(e)}")
+            except Exception as e:
+                self.logger.error(f"Error saving OSM file: {e}")
+                raise ValueError(f"Failed to save OSM file: {str(e)}")
 
     def convert_to_idf(self, output_path: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -423,6 +466,30 @@ class OpenStudioManager:
             self.logger.error(f"Error getting building info: {e}")
             raise ValueError(f"Failed to get building info: {str(e)}")
 
+
+    @staticmethod
+    def _dedupe_record_strings(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Collapse repeated string values in a record list to one shared object.
+
+        Categorical fields (space types, schedule names, construction names)
+        repeat the same literal across hundreds of records on large models;
+        pooling them cuts result-list memory and makes later equality checks
+        pointer comparisons.
+
+        Args:
+            records: List of per-object dictionaries (modified in place)
+
+        Returns:
+            The same list, with duplicated string values shared
+        """
+        pool: Dict[str, str] = {}
+        for record in records:
+            for key, value in record.items():
+                if isinstance(value, str):
+                    record[key] = pool.setdefault(value, value)
+        return records
+
     def get_all_spaces(self) -> Dict[str, Any]:
         """
         Get all spaces from the current model.
@@ -439,7 +506,7 @@ class OpenStudioManager:
             from openstudio_toolkit.osm_objects.spaces import get_all_space_objects_as_dataframe
 
             df = get_all_space_objects_as_dataframe(self.current_model)
-            spaces = df.to_dict(orient='records')
+            spaces = self._dedupe_record_strings(df.to_dict(orient='records'))
 
             return {
                 "status": "success",
@@ -501,7 +568,7 @@ class OpenStudioManager:
             )
 
             df = get_all_thermal_zones_objects_as_dataframe(self.current_model)
-            zones = df.to_dict(orient='records')
+            zones = self._dedupe_record_strings(df.to_dict(orient='records'))
 
             return {
                 "status": "success",
@@ -570,7 +637,7 @@ class OpenStudioManager:
 
             df = get_all_opaque_material_objects_as_dataframe(
                 self.current_model)
-            materials = df.to_dict(orient='records')
+            materials = self._dedupe_record_strings(df.to_dict(orient='records'))
 
             return {
                 "status": "success",
@@ -604,7 +671,7 @@ class OpenStudioManager:
             )
 
             df = get_all_air_loop_hvac_objects_as_dataframe(self.current_model)
-            air_loops = df.to_dict(orient='records')
+            air_loops = self._dedupe_record_strings(df.to_dict(orient='records'))
 
             return {
                 "status": "success",
@@ -638,7 +705,7 @@ class OpenStudioManager:
             )
 
             df = get_all_people_objects_as_dataframe(self.current_model)
-            people = df.to_dict(orient='records')
+            people = self._dedupe_record_strings(df.to_dict(orient='records'))
 
             return {
                 "status": "success",
@@ -668,7 +735,7 @@ class OpenStudioManager:
             )
 
             df = get_all_lights_objects_as_dataframe(self.current_model)
-            lights = df.to_dict(orient='records')
+            lights = self._dedupe_record_strings(df.to_dict(orient='records'))
 
             return {
                 "status": "success",
@@ -699,7 +766,7 @@ class OpenStudioManager:
 
             df = get_all_electric_equipment_objects_as_dataframe(
                 self.current_model)
-            equipment = df.to_dict(orient='records')
+            equipment = self._dedupe_record_strings(df.to_dict(orient='records'))
 
             return {
                 "status": "success",
@@ -734,7 +801,7 @@ class OpenStudioManager:
 
             df = get_all_schedule_ruleset_objects_as_dataframe(
                 self.current_model)
-            schedules = df.to_dict(orient='records')
+            schedules = self._dedupe_record_strings(df.to_dict(orient='records'))
 
             return {
                 "status": "success",
@@ -746,6 +813,60 @@ class OpenStudioManager:
             self.logger.error(f"Error getting schedule rulesets: {e}")
             raise ValueError(f"Failed to get schedule rulesets: {str(e)}")
 
+
+    def get_model_overview(self, include: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Get several model inventories in a single call.
+
+        Bundles the per-category getters so agents inspecting a model
+        category-by-category pay one tool round-trip instead of up to eight.
+        Each section carries the same payload as its standalone tool.
+
+        Args:
+            include: Optional list of section names to collect; defaults to
+                all sections (spaces, thermal_zones, materials, air_loops,
+                people_loads, lighting_loads, electric_equipment,
+                schedule_rulesets)
+
+        Returns:
+            Dictionary with one entry per requested section
+
+        Raises:
+            ValueError: If no model is loaded or a section name is unknown
+        """
+        self._check_model_loaded()
+
+        getters = {
+            "spaces": self.get_all_spaces,
+            "thermal_zones": self.get_all_thermal_zones,
+            "materials": self.get_all_materials,
+            "air_loops": self.get_all_air_loops,
+            "people_loads": self.get_all_people_loads,
+            "lighting_loads": self.get_all_lighting_loads,
+            "electric_equipment": self.get_all_electric_equipment,
+            "schedule_rulesets": self.get_all_schedule_rulesets,
+        }
+
+        if include:
+            unknown = [name for name in include if name not in getters]
+            if unknown:
+                raise ValueError(
+                    f"Unknown overview sections: {unknown}. "
+                    f"Valid sections: {sorted(getters)}")
+            selected = include
+        else:
+            selected = list(getters)
+
+        sections: Dict[str, Any] = {}
+        for name in selected:
+            try:
+                sections[name] = getters[name]()
+            except ValueError as e:
+                # one failing category shouldn't sink the whole overview
+                sections[name] = {"status": "error", "error": str(e)}
+
+        return {"status": "success", "sections": sections}
+
     # =========================================================================
     # SPACE TYPE AND CONSTRUCTION SET WIZARD
     # =========================================================================
@@ -780,82 +901,84 @@ class OpenStudioManager:
         Raises:
             ValueError: If validation fails or wizard execution fails
         """
-        try:
-            # Step 1: Resolve model path or use current model
-            if model_path:
-                resolved_path = resolve_osm_path(self.config, model_path)
-                # Load the model
-                from openstudio_toolkit.utils.osm_utils import load_osm_file_as_model
-                model = load_osm_file_as_model(
-                    resolved_path, translate_version=True)
-                self.logger.info(f"Loaded model from: {resolved_path}")
-            else:
-                self._check_model_loaded()
-                model = self.current_model
-                resolved_path = self.current_file_path
-                self.logger.info("Using current loaded model")
-
-            # Step 2: Prepare arguments for wizard
-            wizard_args = {
-                "building_type": building_type,
-                "template": template,
-                "climate_zone": climate_zone,
-                "create_space_types": create_space_types,
-                "create_construction_set": create_construction_set,
-                "set_building_defaults": set_building_defaults,
-            }
-
-            # Step 3: Validate arguments
-            self.logger.info(f"Validating wizard arguments: {wizard_args}")
-            is_valid = validate_apply_space_type_and_construction_set_wizard(
-                model, **wizard_args)
-
-            if not is_valid:
+        with self._state_lock:
+            try:
+                # Step 1: Resolve model path or use current model
+                if model_path:
+                    resolved_path = resolve_osm_path(self.config, model_path)
+                    # Load the model
+                    from openstudio_toolkit.utils.osm_utils import load_osm_file_as_model
+                    model = load_osm_file_as_model(
+                        resolved_path, translate_version=True)
+                    self.logger.info(f"Loaded model from: {resolved_path}")
+                else:
+                    self._check_model_loaded()
+                    model = self.current_model
+                    resolved_path = self.current_file_path
+                    self.logger.info("Using current loaded model")
+
+                # Step 2: Prepare arguments for wizard
+                wizard_args = {
+                    "building_type": building_type,
+                    "template": template,
+                    "climate_zone": climate_zone,
+                    "create_space_types": create_space_types,
+                    "create_construction_set": create_construction_set,
+                    "set_building_defaults": set_building_defaults,
+                }
+
+                # Step 3: Validate arguments
+                self.logger.info(f"Validating wizard arguments: {wizard_args}")
+                is_valid = validate_apply_space_type_and_construction_set_wizard(
+                    model, **wizard_args)
+
+                if not is_valid:
+                    raise ValueError(
+                        f"Invalid wizard arguments. "
+                        f"Building type: {building_type}, Template: {template}, "
+                        f"Climate zone: {climate_zone}"
+                    )
+
+                # Step 4: Run the wizard
+                self.logger.info("Running Space Type Wizard...")
+                updated_model = run_apply_space_type_and_construction_set_wizard(
+                    model, **wizard_args)
+
+                # Step 5: Update current model
+                self.current_model = updated_model
+                self.model_loaded = True
+
+                # Step 6: Save the model to disk
+                if resolved_path:
+                    save_result = self.save_osm_file(resolved_path)
+                    saved_path = save_result.get("file_path", resolved_path)
+                else:
+                    # If no path, save to outputs with timestamped name
+                    output_filename = f"wizard_applied_{datetime.now().strftime('%Y%m%d_%H%M%S')}.osm"
+                    output_path = resolve_output_path(self.config, output_filename)
+                    save_result = self.save_osm_file(output_path)
+                    saved_path = save_result.get("file_path", output_path)
+                    self.current_file_path = saved_path
+
+                self.logger.info(
+                    f"Wizard applied successfully. Model saved to: {saved_path}")
+
+                return {
+                    "status": "success",
+                    "message": f"Space Type and Construction Set Wizard applied successfully",
+                    "building_type": building_type,
+                    "template": template,
+                    "climate_zone": climate_zone,
+                    "space_types_created": create_space_types,
+                    "construction_set_created": create_construction_set,
+                    "model_saved_to": saved_path,
+                }
+
+            except Exception as e:
+                self.logger.error(
+                    f"Error applying Space Type and Construction Set Wizard: {e}")
                 raise ValueError(
-                    f"Invalid wizard arguments. "
-                    f"Building type: {building_type}, Template: {template}, "
-                    f"Climate zone: {climate_zone}"
-                )
-
-            # Step 4: Run the wizard
-            self.logger.info("Running Space Type Wizard...")
-            updated_model = run_apply_space_type_and_construction_set_wizard(
-                model, **wizard_args)
-
-            # Step 5: Update current model
-            self.current_model = updated_model
-
-            # Step 6: Save the model to disk
-            if resolved_path:
-                save_result = self.save_osm_file(resolved_path)
-                saved_path = save_result.get("file_path", resolved_path)
-            else:
-                # If no path, save to outputs with timestamped name
-                output_filename = f"wizard_applied_{datetime.now().strftime('%Y%m%d_%H%M%S')}.osm"
-                output_path = resolve_output_path(self.config, output_filename)
-                save_result = self.save_osm_file(output_path)
-                saved_path = save_result.get("file_path", output_path)
-                self.current_file_path = saved_path
-
-            self.logger.info(
-                f"Wizard applied successfully. Model saved to: {saved_path}")
-
-            return {
-                "status": "success",
-                "message": f"Space Type and Construction Set Wizard applied successfully",
-                "building_type": building_type,
-                "template": template,
-                "climate_zone": climate_zone,
-                "space_types_created": create_space_types,
-                "construction_set_created": create_construction_set,
-                "model_saved_to": saved_path,
-            }
-
-        except Exception as e:
-            self.logger.error(
-                f"Error applying Space Type and Construction Set Wizard: {e}")
-            raise ValueError(
-                f"Failed to apply Space Type and Construction Set Wizard: {str(e)}")
+                    f"Failed to apply Space Type and Construction Set Wizard: {str(e)}")
 
     # =========================================================================
     # VIEW MODEL
@@ -5,16 +5,21 @@ This module defines the MCP server and all available tools for
 working with OpenStudio building energy models.
 """
 
+import asyncio
+import functools
 import logging
 import json
+import os
 import sys
-from typing import Optional, Any, Union
+from collections import OrderedDict
+from typing import List, Optional, Any, Union
 
 from mcp.server.fastmcp import FastMCP
 
 from openstudio_mcp_server.config import get_config, get_configuration_info
 from openstudio_mcp_server.openstudio_tools import OpenStudioManager
-from openstudio_mcp_server.utils.json_utils import ensure_json_response
+from openstudio_mcp_server.utils.json_stream import stream_list_response
+from openstudio_mcp_server.utils.json_utils import ensure_json_response, maybe_compress_response
 
 # Initialize configuration and logger
 config = get_config()
@@ -28,6 +33,93 @@ os_manager = OpenStudioManager(config)
 
 logger.info(f"Starting {config.server.name} v{config.server.version}")
 
+# Read-only inspector tools are pure functions of the currently loaded model,
+# and agents tend to call the same one repeatedly in a session. Their
+# serialized responses are cached per (epoch, model path, mtime, tool, args);
+# tools that replace or mutate the model bump the epoch to invalidate
+# everything at once (an in-memory edit doesn't change the file mtime).
+# LRU-bounded like the model cache: per-name detail responses can be large,
+# so old entries are evicted instead of accumulating for the whole session.
+_tool_cache = OrderedDict()
+_tool_cache_size = int(os.environ.get("OSMCP_TOOL_CACHE_SIZE", "32"))
+_tool_cache_epoch = 0
+
+# Config is immutable after startup, so the server-info response and the
+# "no model loaded" status are serialized exactly once at import
+_SERVER_INFO_JSON = ensure_json_response(
+    {"status": "success", "configuration": get_configuration_info(config)}
+)
+_NO_MODEL_JSON = ensure_json_response({
+    "status": "success",
+    "model_loaded": False,
+    "message": "No model currently loaded. Use load_osm_model to load a model."
+})
+# Loaded-model status only varies by file_path; clients poll this, so the
+# rest of the payload is a pre-serialized template
+_STATUS_LOADED_TMPL = (
+    '{"status":"success","model_loaded":true,"file_path":%s,'
+    '"message":"Model is loaded and ready for operations."}'
+)
+
+
+def _invalidate_tool_cache() -> None:
+    """Drop all cached tool responses (called by model-mutating tools)."""
+    global _tool_cache_epoch
+    _tool_cache_epoch += 1
+    _tool_cache.clear()
+
+
+def tool_errors(fn):
+    """Shared error handling for tool functions.
+
+    Every tool carried the same ~10-line try/except/log/serialize tail;
+    factoring it here compiles the exception table once, shrinks each tool
+    to its happy path, and gives one place to instrument failures.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except FileNotFoundError as e:
+            logger.warning("File not found in %s: %s", fn.__name__, e)
+            return ensure_json_response({"status": "error", "error": str(e)})
+        except ValueError as e:
+            logger.warning("Validation error in %s: %s", fn.__name__, e)
+            return ensure_json_response({"status": "error", "error": str(e)})
+        except Exception as e:
+            logger.error("Error in %s: %s", fn.__name__, e, exc_info=True)
+            return ensure_json_response({"status": "error", "error": str(e)})
+
+    return wrapper
+
+
+def cached_tool(fn):
+    """Cache a read-only tool's JSON response for the current model state."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        path = os_manager.current_file_path
+        if not path:
+            return await fn(*args, **kwargs)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return await fn(*args, **kwargs)
+        key = (_tool_cache_epoch, path, mtime_ns, fn.__name__,
+               args, tuple(sorted(kwargs.items())))
+        cached = _tool_cache.get(key)
+        if cached is None:
+            cached = await fn(*args, **kwargs)
+            _tool_cache[key] = cached
+            while len(_tool_cache) > _tool_cache_size:
+                _tool_cache.popitem(last=False)
+        else:
+            _tool_cache.move_to_end(key)
+        return cached
+
+    return wrapper
+
 
 # =============================================================================
 # CATEGORY 1: FILE & MODEL MANAGEMENT TOOLS
@@ -35,6 +127,7 @@ logger.info(f"Starting {config.server.name} v{config.server.version}")
 
 
 @mcp.tool()
+@tool_errors
 async def load_osm_model(file_path: str, translate_version: bool = True) -> str:
     """Load an OpenStudio Model (OSM) file.
 
@@ -53,21 +146,14 @@ async def load_osm_model(file_path: str, translate_version: bool = True) -> str:
         load_osm_model("sample_files/models/example.osm")
         load_osm_model("/path/to/my/model.osm", translate_version=False)
     """
-    try:
-        logger.info(f"Tool called: load_osm_model(file_path='{file_path}')")
-        result = os_manager.load_osm_file(file_path, translate_version)
-        return ensure_json_response(result)
-
-    except FileNotFoundError as e:
-        logger.warning(f"File not found: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error loading OSM file: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": f"Failed to load OSM file: {str(e)}"})
+    logger.info("Tool called: load_osm_model(file_path=%r)", file_path)
+    _invalidate_tool_cache()
+    result = await asyncio.to_thread(os_manager.load_osm_file, file_path, translate_version)
+    return ensure_json_response(result)
 
 
 @mcp.tool()
+@tool_errors
 async def save_osm_model(file_path: Optional[str] = None) -> str:
     """Save the current OpenStudio Model to an OSM file.
 
@@ -81,21 +167,14 @@ async def save_osm_model(file_path: Optional[str] = None) -> str:
         save_osm_model()  # Save to current file path
         save_osm_model("output/modified_model.osm")
     """
-    try:
-        logger.info(f"Tool called: save_osm_model(file_path='{file_path}')")
-        result = os_manager.save_osm_file(file_path)
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error saving OSM file: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": f"Failed to save OSM file: {str(e)}"})
+    logger.info("Tool called: save_osm_model(file_path=%r)", file_path)
+    _invalidate_tool_cache()
+    result = await asyncio.to_thread(os_manager.save_osm_file, file_path)
+    return ensure_json_response(result)
 
 
 @mcp.tool()
+@tool_errors
 async def convert_to_idf(output_path: Optional[str] = None) -> str:
     """Convert the current OpenStudio Model to EnergyPlus IDF format.
 
@@ -112,22 +191,15 @@ async def convert_to_idf(output_path: Optional[str] = None) -> str:
         convert_to_idf()  # Auto-generate output path
         convert_to_idf("output/model.idf")
     """
-    try:
-        logger.info(
-            f"Tool called: convert_to_idf(output_path='{output_path}')")
-        result = os_manager.convert_to_idf(output_path)
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error converting to IDF: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": f"Failed to convert to IDF: {str(e)}"})
+    logger.info("Tool called: convert_to_idf(output_path=%r)", output_path)
+    # CPU-heavy SDK translation: run it off the event loop so other tool
+    # calls keep dispatching while the conversion grinds
+    result = await asyncio.to_thread(os_manager.convert_to_idf, output_path)
+    return ensure_json_response(result)
 
 
 @mcp.tool()
+@tool_errors
 async def copy_file(
     source_path: str,
     target_path: str,
@@ -173,23 +245,18 @@ async def copy_file(
         # Copy user-uploaded file to workspace
         copy_file("/mnt/user-data/uploads/model.osm", "workspace/model.osm")
     """
-    try:
-        logger.info(
-            f"Tool called: copy_file(source='{source_path}', target='{target_path}', "
-            f"overwrite={overwrite}, file_types={file_types})"
-        )
-        result = os_manager.copy_file(
-            source_path, target_path, overwrite, file_types)
-        return ensure_json_response(result)
-
-    except Exception as e:
-        logger.error(f"Error copying file: {e}", exc_info=True)
-        return ensure_json_response(
-            {"status": "error", "error": f"Failed to copy file: {str(e)}"}
-        )
+    logger.info(
+        "Tool called: copy_file(source=%r, target=%r, overwrite=%s, file_types=%s)",
+        source_path, target_path, overwrite, file_types
+    )
+    result = await asyncio.to_thread(
+        os_manager.copy_file, source_path, target_path, overwrite, file_types)
+    return ensure_json_response(result)
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def get_model_summary() -> str:
     """Get a comprehensive summary of the current OpenStudio model.
 
@@ -202,21 +269,14 @@ async def get_model_summary() -> str:
     Examples:
         get_model_summary()
     """
-    try:
-        logger.info("Tool called: get_model_summary()")
-        result = os_manager.get_model_summary()
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error getting model summary: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: get_model_summary()")
+    result = await asyncio.to_thread(os_manager.get_model_summary)
+    return ensure_json_response(result)
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def get_building_info() -> str:
     """Get building object information from the current model.
 
@@ -229,18 +289,9 @@ async def get_building_info() -> str:
     Examples:
         get_building_info()
     """
-    try:
-        logger.info("Tool called: get_building_info()")
-        result = os_manager.get_building_info()
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error getting building info: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: get_building_info()")
+    result = await asyncio.to_thread(os_manager.get_building_info)
+    return ensure_json_response(result)
 
 
 # =============================================================================
@@ -249,6 +300,8 @@ async def get_building_info() -> str:
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def list_spaces() -> str:
     """List all spaces in the current OpenStudio model.
 
@@ -261,21 +314,14 @@ async def list_spaces() -> str:
     Examples:
         list_spaces()
     """
-    try:
-        logger.info("Tool called: list_spaces()")
-        result = os_manager.get_all_spaces()
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error listing spaces: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: list_spaces()")
+    result = await asyncio.to_thread(os_manager.get_all_spaces)
+    return stream_list_response(result, "spaces")
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def get_space_details(space_name: str) -> str:
     """Get detailed information about a specific space.
 
@@ -288,22 +334,14 @@ async def get_space_details(space_name: str) -> str:
     Examples:
         get_space_details("Office 101")
     """
-    try:
-        logger.info(
-            f"Tool called: get_space_details(space_name='{space_name}')")
-        result = os_manager.get_space_by_name(space_name)
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error getting space details: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: get_space_details(space_name=%r)", space_name)
+    result = await asyncio.to_thread(os_manager.get_space_by_name, space_name)
+    return ensure_json_response(result)
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def list_thermal_zones() -> str:
     """List all thermal zones in the current OpenStudio model.
 
@@ -316,21 +354,14 @@ async def list_thermal_zones() -> str:
     Examples:
         list_thermal_zones()
     """
-    try:
-        logger.info("Tool called: list_thermal_zones()")
-        result = os_manager.get_all_thermal_zones()
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error listing thermal zones: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: list_thermal_zones()")
+    result = await asyncio.to_thread(os_manager.get_all_thermal_zones)
+    return stream_list_response(result, "thermal_zones")
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def get_thermal_zone_details(zone_name: str) -> str:
     """Get detailed information about a specific thermal zone.
 
@@ -343,19 +374,9 @@ async def get_thermal_zone_details(zone_name: str) -> str:
     Examples:
         get_thermal_zone_details("Zone 1")
     """
-    try:
-        logger.info(
-            f"Tool called: get_thermal_zone_details(zone_name='{zone_name}')")
-        result = os_manager.get_thermal_zone_by_name(zone_name)
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error getting thermal zone details: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: get_thermal_zone_details(zone_name=%r)", zone_name)
+    result = await asyncio.to_thread(os_manager.get_thermal_zone_by_name, zone_name)
+    return ensure_json_response(result)
 
 
 # =============================================================================
@@ -364,6 +385,8 @@ async def get_thermal_zone_details(zone_name: str) -> str:
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def list_materials() -> str:
     """List all materials in the current OpenStudio model.
 
@@ -377,18 +400,9 @@ async def list_materials() -> str:
     Examples:
         list_materials()
     """
-    try:
-        logger.info("Tool called: list_materials()")
-        result = os_manager.get_all_materials()
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error listing materials: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: list_materials()")
+    result = await asyncio.to_thread(os_manager.get_all_materials)
+    return stream_list_response(result, "materials")
 
 
 # =============================================================================
@@ -397,6 +411,8 @@ async def list_materials() -> str:
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def list_air_loops() -> str:
     """List all air loop HVAC systems in the current OpenStudio model.
 
@@ -409,18 +425,9 @@ async def list_air_loops() -> str:
     Examples:
         list_air_loops()
     """
-    try:
-        logger.info("Tool called: list_air_loops()")
-        result = os_manager.get_all_air_loops()
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error listing air loops: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: list_air_loops()")
+    result = await asyncio.to_thread(os_manager.get_all_air_loops)
+    return stream_list_response(result, "air_loops")
 
 
 # =============================================================================
@@ -429,6 +436,8 @@ async def list_air_loops() -> str:
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def list_people_loads() -> str:
     """List all people (occupancy) loads in the current OpenStudio model.
 
@@ -441,21 +450,14 @@ async def list_people_loads() -> str:
     Examples:
         list_people_loads()
     """
-    try:
-        logger.info("Tool called: list_people_loads()")
-        result = os_manager.get_all_people_loads()
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error listing people loads: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: list_people_loads()")
+    result = await asyncio.to_thread(os_manager.get_all_people_loads)
+    return stream_list_response(result, "people_loads")
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def list_lighting_loads() -> str:
     """List all lighting loads in the current OpenStudio model.
 
@@ -468,21 +470,14 @@ async def list_lighting_loads() -> str:
     Examples:
         list_lighting_loads()
     """
-    try:
-        logger.info("Tool called: list_lighting_loads()")
-        result = os_manager.get_all_lighting_loads()
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error listing lighting loads: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: list_lighting_loads()")
+    result = await asyncio.to_thread(os_manager.get_all_lighting_loads)
+    return stream_list_response(result, "lighting_loads")
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def list_electric_equipment() -> str:
     """List all electric equipment loads in the current OpenStudio model.
 
@@ -495,18 +490,9 @@ async def list_electric_equipment() -> str:
     Examples:
         list_electric_equipment()
     """
-    try:
-        logger.info("Tool called: list_electric_equipment()")
-        result = os_manager.get_all_electric_equipment()
-        return ensure_json_response(result)
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
-
-    except Exception as e:
-        logger.error(f"Error listing electric equipment: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: list_electric_equipment()")
+    result = await asyncio.to_thread(os_manager.get_all_electric_equipment)
+    return stream_list_response(result, "electric_equipment")
 
 
 # =============================================================================
@@ -515,6 +501,8 @@ async def list_electric_equipment() -> str:
 
 
 @mcp.tool()
+@tool_errors
+@cached_tool
 async def list_schedule_rulesets() -> str:
     """List all schedule rulesets in the current OpenStudio model.
 
@@ -527,18 +515,40 @@ async def list_schedule_rulesets() -> str:
     Examples:
         list_schedule_rulesets()
     """
-    try:
-        logger.info("Tool called: list_schedule_rulesets()")
-        result = os_manager.get_all_schedule_rulesets()
-        return ensure_json_response(result)
+    logger.info("Tool called: list_schedule_rulesets()")
+    result = await asyncio.to_thread(os_manager.get_all_schedule_rulesets)
+    return stream_list_response(result, "schedule_rulesets")
 
-    except ValueError as e:
-        logger.warning(f"Validation error: {e}")
-        return ensure_json_response({"status": "error", "error": str(e)})
 
-    except Exception as e:
-        logger.error(f"Error listing schedule rulesets: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+
+@mcp.tool()
+@tool_errors
+async def get_model_overview(include: Optional[List[str]] = None) -> str:
+    """Get several model inventories in a single call.
+
+    Bundles the list tools (spaces, thermal zones, materials, air loops,
+    people/lighting/equipment loads, schedule rulesets) into one response so
+    a model can be surveyed with a single tool round-trip instead of up to
+    eight.
+
+    Args:
+        include: Optional list of section names to collect (default: all).
+                 Valid names: spaces, thermal_zones, materials, air_loops,
+                 people_loads, lighting_loads, electric_equipment,
+                 schedule_rulesets
+
+    Returns:
+        JSON string with one entry per requested section
+
+    Examples:
+        get_model_overview()
+        get_model_overview(include=["spaces", "thermal_zones"])
+    """
+    logger.info("Tool called: get_model_overview(include=%s)", include)
+    result = await asyncio.to_thread(os_manager.get_model_overview, include)
+    # the overview bundles every list tool's records, so it is the response
+    # most likely to exceed the compression threshold
+    return maybe_compress_response(ensure_json_response(result))
 
 
 # =============================================================================
@@ -559,17 +569,12 @@ async def get_server_info() -> str:
     Examples:
         get_server_info()
     """
-    try:
-        logger.info("Tool called: get_server_info()")
-        result = get_configuration_info(config)
-        return ensure_json_response({"status": "success", "configuration": result})
-
-    except Exception as e:
-        logger.error(f"Error getting server info: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: get_server_info()")
+    return _SERVER_INFO_JSON
 
 
 @mcp.tool()
+@tool_errors
 async def get_current_model_status() -> str:
     """Get status of the currently loaded model.
 
@@ -582,29 +587,16 @@ async def get_current_model_status() -> str:
     Examples:
         get_current_model_status()
     """
-    try:
-        logger.info("Tool called: get_current_model_status()")
-
-        if os_manager.current_model is None:
-            return ensure_json_response({
-                "status": "success",
-                "model_loaded": False,
-                "message": "No model currently loaded. Use load_osm_model to load a model."
-            })
-
-        return ensure_json_response({
-            "status": "success",
-            "model_loaded": True,
-            "file_path": os_manager.current_file_path,
-            "message": "Model is loaded and ready for operations."
-        })
+    logger.info("Tool called: get_current_model_status()")
 
-    except Exception as e:
-        logger.error(f"Error getting model status: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    if not os_manager.model_loaded:
+        return _NO_MODEL_JSON
+
+    return _STATUS_LOADED_TMPL % json.dumps(os_manager.current_file_path)
 
 
 @mcp.tool()
+@tool_errors
 async def apply_space_type_and_construction_set_wizard(
     building_type: str,
     template: str,
@@ -671,27 +663,26 @@ async def apply_space_type_and_construction_set_wizard(
         # Apply wizard for school, creating only space types
         apply_space_type_and_construction_set_wizard("PrimarySchool", "90.1-2016", "ASHRAE 169-2013-4A", create_construction_set=False)
     """
-    try:
-        logger.info(f"Tool called: apply_space_type_and_construction_set_wizard(building_type={building_type}, "
-                    f"template={template}, climate_zone={climate_zone})")
-
-        result = os_manager.apply_space_type_and_construction_set_wizard(
-            building_type=building_type,
-            template=template,
-            climate_zone=climate_zone,
-            create_space_types=create_space_types,
-            create_construction_set=create_construction_set,
-            set_building_defaults=set_building_defaults,
-            model_path=model_path
-        )
-        return ensure_json_response(result)
-
-    except Exception as e:
-        logger.error(f"Error applying Space Type Wizard: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Tool called: apply_space_type_and_construction_set_wizard("
+                "building_type=%s, template=%s, climate_zone=%s)",
+                building_type, template, climate_zone)
+    _invalidate_tool_cache()
+
+    result = await asyncio.to_thread(
+        os_manager.apply_space_type_and_construction_set_wizard,
+        building_type=building_type,
+        template=template,
+        climate_zone=climate_zone,
+        create_space_types=create_space_types,
+        create_construction_set=create_construction_set,
+        set_building_defaults=set_building_defaults,
+        model_path=model_path
+    )
+    return ensure_json_response(result)
 
 
 @mcp.tool()
+@tool_errors
 async def apply_view_model(
     output_filename: str = "model_report.html"
 ) -> str:
@@ -717,14 +708,9 @@ async def apply_view_model(
     Example:
         apply_view_model("my_building_report.html")
     """
-    try:
-        logger.info(f"Applying View Model measure: {output_filename}")
-        result = os_manager.apply_view_model(output_filename=output_filename)
-        return ensure_json_response(result)
-
-    except Exception as e:
-        logger.error(f"Error applying View Model measure: {e}", exc_info=True)
-        return ensure_json_response({"status": "error", "error": str(e)})
+    logger.info("Applying View Model measure: %s", output_filename)
+    result = os_manager.apply_view_model(output_filename=output_filename)
+    return ensure_json_response(result)
 
 
 # =============================================================================
@@ -0,0 +1,42 @@
+"""Incremental JSON serialization for large list responses."""
+
+import io
+from typing import Any, Dict
+
+from openstudio_mcp_server.utils.json_utils import _dumps, maybe_compress_response
+
+
+def stream_list_response(result: Dict[str, Any], items_key: str) -> str:
+    """
+    Serialize a list-style response ({meta..., items_key: [items]}) incrementally.
+
+    The list tools can return hundreds of records on big models; encoding the
+    whole response dict in one call holds the full payload twice (records plus
+    the encoder's working copy). This writes the metadata fields and then each
+    item straight into one buffer, so peak memory stays at ~1x the payload
+    plus a single record.
+
+    Args:
+        result: Response dictionary from an OpenStudioManager get_all_* method
+        items_key: Key in `result` holding the list of records
+
+    Returns:
+        Compact JSON string equivalent to serializing `result` whole
+    """
+    buf = io.StringIO()
+    buf.write("{")
+    for key, value in result.items():
+        if key == items_key:
+            continue
+        buf.write(_dumps(key, indent=False))
+        buf.write(":")
+        buf.write(_dumps(value, indent=False))
+        buf.write(",")
+    buf.write(_dumps(items_key, indent=False))
+    buf.write(":[")
+    for i, item in enumerate(result.get(items_key) or ()):
+        if i:
+            buf.write(",")
+        buf.write(_dumps(item, indent=False))
+    buf.write("]}")
+    return maybe_compress_response(buf.getvalue())
@@ -1,8 +1,80 @@
 """JSON serialization utilities for OpenStudio MCP Server."""
 
+import base64
+import gzip
 import json
+import os
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Responses are compact by default: MCP clients parse them mechanically and
+# indentation inflates the stdio payload 30-50% on large list responses.
+# Set OSMCP_PRETTY_JSON=1 to pretty-print when debugging raw logs.
+PRETTY = os.environ.get("OSMCP_PRETTY_JSON") == "1"
+
+# Serialized responses above this many characters get gzip+base64 wrapped
+# before going over stdio (0 disables compression entirely)
+COMPRESS_THRESHOLD = int(os.environ.get("OSMCP_COMPRESS_THRESHOLD", "512000"))
+
+
+def maybe_compress_response(payload: str) -> str:
+    """
+    Wrap an oversize JSON payload in a gzip+base64 envelope.
+
+    Dense list responses (materials plus constructions on a big model) can
+    run to several MB of JSON; the repeated keys compress extremely well, so
+    over-threshold payloads are shipped as
+    {"status": "success", "encoding": "gzip+base64", "payload": "..."}
+    and decoded by the client on demand. Payloads at or under the threshold
+    pass through untouched.
+
+    Args:
+        payload: Serialized JSON response string
+
+    Returns:
+        The original string, or the compressed envelope if it was oversize
+    """
+    if COMPRESS_THRESHOLD <= 0 or len(payload) <= COMPRESS_THRESHOLD:
+        return payload
+    encoded = base64.b64encode(gzip.compress(payload.encode())).decode()
+    return _dumps({
+        "status": "success",
+        "encoding": "gzip+base64",
+        "payload": encoded,
+    }, indent=False)
+
+
+def _dumps(obj: Any, indent: bool = PRETTY) -> str:
+    """Serialize obj to a JSON string, preferring orjson when available.
+
+    orjson serializes in native code (3-10x faster than stdlib json for the
+    large list responses) and is a declared dependency; the stdlib fallback
+    keeps the server usable in environments where it isn't installed.
+
+    Args:
+        obj: Object to serialize (non-JSON types fall back to str())
+        indent: Whether to pretty-print with 2-space indentation
+            (defaults to the OSMCP_PRETTY_JSON env flag)
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches the stdlib's silent key coercion, so a
+        # dict with e.g. int keys serializes the same on both paths instead
+        # of tripping orjson's strict-keys TypeError
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str).decode()
+    if indent:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
 
 def ensure_json_response(result: Any) -> str:
     """
@@ -33,15 +105,12 @@ def ensure_json_response(result: Any) -> str:
                 return result  # It's valid JSON string
             except json.JSONDecodeError:
                 # It's a raw string message, wrap it
-                return json.dumps({"status": "success", "message": result}, indent=2)
+                return _dumps({"status": "success", "message": result})
 
         # If it's a list, dict, or other object, serialize it properly
-        # Use default=str to handle objects that aren't normally JSON serializable
-        return json.dumps(result, indent=2, default=str)
+        # default=str handles objects that aren't normally JSON serializable
+        return _dumps(result)
 
     except Exception as e:
         # Fallback for unserializable objects (Safe, no recursion)
-        return json.dumps(
-            {"status": "error", "error": f"Serialization error: {str(e)}"},
-            indent=2
-        )
+        return _dumps({"status": "error", "error": f"Serialization error: {str(e)}"})
@@ -13,111 +13,185 @@ This is a lightweight parser that relies on the IDF-like layout used in these OS
 It does not use OpenStudio Python bindings so it is portable in CI / developer shells.
 """
 import csv
+import functools
 import json
+import logging
+import mmap
 import os
 import re
+import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
+import pandas as pd
 
-def read_objects(osm_path):
-    """Yield (type_name, values_list) for each OS:* object in the file."""
-    objs = []
-    with open(osm_path, 'r', encoding='utf-8', errors='ignore') as f:
-        lines = f.readlines()
-
-    i = 0
-    n = len(lines)
-    while i < n:
-        line = lines[i].strip()
-        if line.startswith('OS:'):
-            # object header like: OS:Space,
-            type_name = line.split(',')[0].strip()
-            i += 1
-            values = []
-            # collect fields until a line ending with ';'
-            while i < n:
-                raw = lines[i]
-                i += 1
-                # remove comment starting with '!' if present
-                if '!' in raw:
-                    raw = raw.split('!')[0]
-                # remove trailing commas/newlines
-                raw = raw.strip()
-                if raw.endswith(','):
-                    raw = raw[:-1].strip()
-                if raw.endswith(';'):
-                    raw = raw[:-1].strip()
-                    if raw == '':
-                        values.append('')
-                    else:
-                        values.append(raw)
-                    break
-                if raw == '':
-                    values.append('')
-                else:
-                    values.append(raw)
-            objs.append((type_name, values))
-        else:
-            i += 1
-    return objs
+try:
+    import orjson  # considerably faster serializer; stdlib json fallback
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Compiled once at import: strip '!' comments to end-of-line, then match a
+# whole OS:* object up to its ';' terminator (the negated class spans
+# newlines, so one C-level scan replaces the per-line state machine).
+# Bytes patterns so they can run directly over an mmap'd file.
+_COMMENT_RE = re.compile(rb'!.*')
+_OBJECT_RE = re.compile(rb'^[ \t]*(OS:[^;]*);', re.MULTILINE)
+
+# Bound .match of a compiled pattern: one callable, no per-token attribute
+# lookups when testing whether a field is a {uuid} handle.
+_IS_UUID = re.compile(r'\{[0-9a-f-]{36}\}', re.IGNORECASE).match
+
+
+def iter_objects(osm_path, types=None, type_prefixes=None):
+    """Yield (type_name, values_list) for each OS:* object in the file.
+
+    This is a generator so that callers can stream objects without holding
+    the whole parsed file in memory at once; peak memory stays at one
+    object regardless of model size. When `types` (a set of type names) is
+    given, objects of other types are skipped before their fields are
+    tokenized, so a parser that needs 3 of ~50 object types never pays for
+    the other 47. `type_prefixes` (a tuple of name prefixes) additionally
+    keeps whole families like 'OS:Thermostat*' without enumerating every
+    member type.
+
+    Each non-header line of an object contributes one value (vertex lines
+    keep their embedded commas), matching the IDF-like layout these OSMs use.
+
+    The file is memory-mapped and scanned as bytes; only the tokens that end
+    up in the output are decoded, so no full-file str copy is ever built.
+    """
+    with open(osm_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty file: nothing to yield
+            return
+        with mm:
+            # Most OSMs carry no '!' comments at all; one C-level find skips
+            # the whole substitution pass in that case.
+            if mm.find(b'!') < 0:
+                text = mm[:]
+            else:
+                text = _COMMENT_RE.sub(b'', mm)
+
+    for match in _OBJECT_RE.finditer(text):
+        body = match.group(1)
+        # object header like: OS:Space,
+        header, _, rest = body.partition(b'\n')
+        type_name = header.split(b',')[0].strip().decode('utf-8', 'ignore')
+        if types is not None and type_name not in types:
+            if type_prefixes is None or not type_name.startswith(type_prefixes):
+                continue
+        values = []
+        for raw in rest.split(b'\n') if rest else ():
+            raw = raw.strip()
+            if raw.endswith(b','):
+                raw = raw[:-1].strip()
+            value = raw.decode('utf-8', 'ignore')
+            # Handles ({uuid}, 38 chars) recur across objects as dict keys;
+            # interning them makes later lookups pointer comparisons instead
+            # of re-hashing the full string each time.
+            if len(value) == 38 and value[0] == '{' and value[-1] == '}':
+                value = sys.intern(value)
+            values.append(value)
+        yield (type_name, values)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_objects_cached(osm_path, mtime, types, type_prefixes):
+    return tuple((type_name, tuple(values))
+                 for type_name, values in iter_objects(osm_path, types, type_prefixes))
+
+
+def read_objects(osm_path, types=None, type_prefixes=None):
+    """Return all OS:* objects of the file as a tuple of (type_name, values).
+
+    `types` / `type_prefixes` optionally restrict the result to a set of
+    object type names and/or name-prefix families. Results are memoized on
+    (path, mtime, filters) so several extractors running against the same
+    file share a single parse; a changed file on disk invalidates the
+    entry. Use iter_objects() to stream without caching.
+    """
+    if types is not None:
+        types = frozenset(types)
+    if type_prefixes is not None:
+        type_prefixes = tuple(sorted(type_prefixes))
+    return _read_objects_cached(
+        osm_path, os.path.getmtime(osm_path), types, type_prefixes)
+
+
+def objects_by_type(osm_path, types=None, type_prefixes=None):
+    """Return a dict mapping object type name to the list of its value tuples.
+
+    Bucketing once lets each extractor iterate only the types it needs
+    instead of re-scanning every object with an if/elif chain on the type.
+    `types` and `type_prefixes` are forwarded to read_objects() so unwanted
+    types are dropped during tokenization rather than parsed and discarded
+    here.
+    """
+    by_type = defaultdict(list)
+    for type_name, values in read_objects(osm_path, types, type_prefixes):
+        by_type[type_name].append(values)
+    return by_type
 
 
 def parse_montijo(osm_path):
-    objs = read_objects(osm_path)
+    # the prefix keeps every OS:Thermostat* flavour, not just DualSetpoint,
+    # so the startswith branch below still sees them all
+    by_type = objects_by_type(osm_path,
+                              types={'OS:ThermalZone', 'OS:Space'},
+                              type_prefixes=('OS:Thermostat',))
     # maps
     zones = {}             # handle -> name
     thermostats = {}      # handle -> name (if found)
     spaces = {}           # handle -> dict(name, floor_area, volume, zone_handle)
 
-    for typ, vals in objs:
+    for typ, objects in by_type.items():
         if typ == 'OS:ThermostatSetpoint:DualSetpoint' or typ.startswith('OS:Thermostat'):
             # Handle, Name, ...
-            if len(vals) >= 2:
-                handle = vals[0]
-                name = vals[1]
-                thermostats[handle] = name
-        elif typ == 'OS:ThermalZone':
-            # Handle, Name, ... thermostat is often near the end; we'll capture by handle->name
-            if len(vals) >= 2:
-                handle = vals[0]
-                name = vals[1]
-                # attempt to find thermostat handle in the values (UUID-like {..})
-                thermo = None
-                for v in reversed(vals):
-                    if v.startswith('{') and v.endswith('}'):
-                        # skip first few that are ports etc — but take the first uuid-like that also appears in thermostats
-                        if v in thermostats:
-                            thermo = thermostats[v]
-                            break
-                        elif thermo is None:
-                            thermo = v
-                zones[handle] = {'name': name, 'thermostat': thermo}
-        elif typ == 'OS:Space':
-            # fields: handle, name, ..., thermal zone handle (index 10), ..., volume(index -3?), floor area(last)
-            handle = vals[0] if len(vals) >= 1 else None
-            name = vals[1] if len(vals) >= 2 else ''
-            # thermal zone handle commonly at index 10 (0-based)
-            zone_handle = vals[10] if len(vals) > 10 else ''
-            # floor area usually last field
-            floor_area = 0.0
-            volume = 0.0
-            try:
-                if len(vals) >= 17:
-                    fa = vals[16]
-                    floor_area = float(fa) if fa not in ('', None) else 0.0
-                else:
-                    # fallback: last field
-                    fa = vals[-1]
-                    floor_area = float(fa) if fa not in ('', None) else 0.0
-            except Exception:
-                floor_area = 0.0
-            try:
-                # volume is often the field before ceiling height / floor area
-                vol_field = vals[-3] if len(vals) >= 3 else ''
-                volume = float(vol_field) if vol_field not in ('', None) else 0.0
-            except Exception:
-                volume = 0.0
-            spaces[handle] = {'name': name, 'floor_area': floor_area, 'volume': volume, 'zone_handle': zone_handle}
+            for vals in objects:
+                if len(vals) >= 2:
+                    thermostats[vals[0]] = vals[1]
+
+    for vals in by_type.get('OS:ThermalZone', ()):
+        # Handle, Name, ... thermostat is often near the end; we'll capture by handle->name
+        if len(vals) >= 2:
+            handle = vals[0]
+            name = vals[1]
+            # attempt to find thermostat handle in the values (UUID-like {..})
+            thermo = None
+            for v in reversed(vals):
+                if _IS_UUID(v):
+                    # skip first few that are ports etc — but take the first uuid-like that also appears in thermostats
+                    if v in thermostats:
+                        thermo = thermostats[v]
+                        break
+                    elif thermo is None:
+                        thermo = v
+            zones[handle] = {'name': name, 'thermostat': thermo}
+
+    # fields: handle, name, ..., thermal zone handle (index 10), ..., volume(index -3?), floor area(last)
+    space_objs = by_type.get('OS:Space', ())
+    # Numeric fields are converted in one vectorized pass (non-numeric/empty
+    # coerce to 0.0) instead of a try/except float() per space.
+    raw_fa = [vals[16] if len(vals) >= 17 else (vals[-1] if vals else '')
+              for vals in space_objs]
+    # volume is often the field before ceiling height / floor area
+    raw_vol = [vals[-3] if len(vals) >= 3 else '' for vals in space_objs]
+    floor_areas = pd.to_numeric(
+        pd.Series(raw_fa, dtype=object), errors='coerce').fillna(0.0).to_numpy()
+    volumes = pd.to_numeric(
+        pd.Series(raw_vol, dtype=object), errors='coerce').fillna(0.0).to_numpy()
+    for vals, floor_area, volume in zip(space_objs, floor_areas, volumes):
+        handle = vals[0] if len(vals) >= 1 else None
+        name = vals[1] if len(vals) >= 2 else ''
+        # thermal zone handle commonly at index 10 (0-based)
+        zone_handle = vals[10] if len(vals) > 10 else ''
+        spaces[handle] = {'name': name, 'floor_area': float(floor_area),
+                          'volume': float(volume), 'zone_handle': zone_handle}
 
     # aggregate spaces into zones
     zone_agg = {}
@@ -162,65 +236,71 @@ def parse_montijo(osm_path):
 
 
 def parse_r2f_lighting(osm_path):
-    objs = read_objects(osm_path)
+    by_type = objects_by_type(osm_path, types={
+        'OS:Lights:Definition', 'OS:Space', 'OS:Lights'})
     # maps
     lights_defs = {}   # handle -> {method, lighting_level, watts_per_area, watts_per_person}
     spaces = {}        # handle -> {name, floor_area}
     lights = []        # list of lights objects
 
-    for typ, vals in objs:
-        if typ == 'OS:Lights:Definition':
-            handle = vals[0] if len(vals) >= 1 else None
-            name = vals[1] if len(vals) >= 2 else ''
-            method = vals[2] if len(vals) >= 3 else ''
-            lighting_level = float(vals[3]) if len(vals) >= 4 and vals[3] not in ('', None) else 0.0
-            watts_per_area = float(vals[4]) if len(vals) >= 5 and vals[4] not in ('', None) else 0.0
-            watts_per_person = float(vals[5]) if len(vals) >= 6 and vals[5] not in ('', None) else 0.0
-            lights_defs[handle] = {'name': name, 'method': method, 'lighting_level_w': lighting_level, 'watts_per_area': watts_per_area, 'watts_per_person': watts_per_person}
-        elif typ == 'OS:Space':
-            handle = vals[0] if len(vals) >= 1 else None
-            name = vals[1] if len(vals) >= 2 else ''
-            # floor area usually last field
+    for vals in by_type.get('OS:Lights:Definition', ()):
+        handle = vals[0] if len(vals) >= 1 else None
+        name = vals[1] if len(vals) >= 2 else ''
+        method = vals[2] if len(vals) >= 3 else ''
+        lighting_level = float(vals[3]) if len(vals) >= 4 and vals[3] not in ('', None) else 0.0
+        watts_per_area = float(vals[4]) if len(vals) >= 5 and vals[4] not in ('', None) else 0.0
+        watts_per_person = float(vals[5]) if len(vals) >= 6 and vals[5] not in ('', None) else 0.0
+        lights_defs[handle] = {'name': name, 'method': method, 'lighting_level_w': lighting_level, 'watts_per_area': watts_per_area, 'watts_per_person': watts_per_person}
+
+    for vals in by_type.get('OS:Space', ()):
+        handle = vals[0] if len(vals) >= 1 else None
+        name = vals[1] if len(vals) >= 2 else ''
+        # floor area usually last field
+        floor_area = 0.0
+        try:
+            if len(vals) >= 17:
+                floor_area = float(vals[16]) if vals[16] != '' else 0.0
+            else:
+                floor_area = float(vals[-1]) if vals[-1] != '' else 0.0
+        except Exception:
             floor_area = 0.0
-            try:
-                if len(vals) >= 17:
-                    floor_area = float(vals[16]) if vals[16] != '' else 0.0
-                else:
-                    floor_area = float(vals[-1]) if vals[-1] != '' else 0.0
-            except Exception:
-                floor_area = 0.0
-            spaces[handle] = {'name': name, 'floor_area': floor_area}
-        elif typ == 'OS:Lights':
-            # handle, name, lights definition name (handle), space or spaceType (handle), schedule, fraction replaceable, multiplier, enduse
-            handle = vals[0] if len(vals) >= 1 else None
-            name = vals[1] if len(vals) >= 2 else ''
-            def_handle = vals[2] if len(vals) >= 3 else ''
-            space_handle = vals[3] if len(vals) >= 4 else ''
-            multiplier = float(vals[6]) if len(vals) >= 7 and vals[6] not in ('', None) else 1.0
-            lights.append({'handle': handle, 'name': name, 'def_handle': def_handle, 'space_handle': space_handle, 'multiplier': multiplier})
-
-    # compute W/m2 per space by summing contributions
-    space_power_w = defaultdict(float)
-    for l in lights:
-        d = lights_defs.get(l['def_handle'], None)
-        space = spaces.get(l['space_handle'], None)
-        if not d or not space:
-            continue
-        method = d.get('method', '')
-        if method == 'Watts/Area' and d.get('watts_per_area', 0.0) > 0.0:
-            wpm2 = d['watts_per_area'] * l['multiplier']
-            space_power_w[l['space_handle']] += wpm2 * space['floor_area']
-        elif method == 'LightingLevel' and d.get('lighting_level_w', 0.0) > 0.0:
-            # lighting level is absolute W for the object
-            total_w = d['lighting_level_w'] * l['multiplier']
-            space_power_w[l['space_handle']] += total_w
-        elif d.get('watts_per_area', 0.0) > 0.0:
-            # fallback
-            wpm2 = d['watts_per_area'] * l['multiplier']
-            space_power_w[l['space_handle']] += wpm2 * space['floor_area']
-        else:
-            # unknown -> skip
-            continue
+        spaces[handle] = {'name': name, 'floor_area': floor_area}
+
+    for vals in by_type.get('OS:Lights', ()):
+        # handle, name, lights definition name (handle), space or spaceType (handle), schedule, fraction replaceable, multiplier, enduse
+        handle = vals[0] if len(vals) >= 1 else None
+        name = vals[1] if len(vals) >= 2 else ''
+        def_handle = vals[2] if len(vals) >= 3 else ''
+        space_handle = vals[3] if len(vals) >= 4 else ''
+        multiplier = float(vals[6]) if len(vals) >= 7 and vals[6] not in ('', None) else 1.0
+        lights.append({'handle': handle, 'name': name, 'def_handle': def_handle, 'space_handle': space_handle, 'multiplier': multiplier})
+
+    # compute W per space vectorized: merge lights with their definition and
+    # space, compute each object's contribution in one numpy expression, then
+    # sum by space. Inner merges drop lights whose def/space is missing, and
+    # the contributes mask drops objects no branch of the old if/elif chain
+    # matched, so spaces with only unknown lights stay absent as before.
+    space_power_w = {}
+    if lights and lights_defs and spaces:
+        lights_df = pd.DataFrame(lights)
+        defs_df = pd.DataFrame.from_dict(lights_defs, orient='index').rename_axis('def_handle').reset_index()
+        spaces_df = pd.DataFrame.from_dict(spaces, orient='index').rename_axis('space_handle').reset_index()
+        merged = lights_df.merge(defs_df, on='def_handle', suffixes=('', '_def'))
+        merged = merged.merge(spaces_df, on='space_handle', suffixes=('', '_space'))
+
+        method = merged['method']
+        wpa = merged['watts_per_area']
+        level = merged['lighting_level_w']
+        mult = merged['multiplier']
+        area = merged['floor_area']
+        # LightingLevel is absolute W for the object; Watts/Area (and the
+        # fallback when watts_per_area is set) scales by the space floor area
+        merged['power_w'] = np.where((method == 'LightingLevel') & (level > 0.0),
+                                     level * mult,
+                                     np.where(wpa > 0.0, wpa * mult * area, 0.0))
+        contributes = ((method == 'LightingLevel') & (level > 0.0)) | (wpa > 0.0)
+        totals = merged[contributes].groupby('space_handle', sort=False)['power_w'].sum()
+        space_power_w = totals.to_dict()
 
     # compute W/m2
     results = []
@@ -239,17 +319,22 @@ def ensure_out_dir():
     os.makedirs('outputs', exist_ok=True)
 
 
-def write_json(path, data):
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+def write_json(path, data, indent=None):
+    """Write `data` as JSON; compact by default, pass indent=2 for human-readable."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
 
 
 def write_csv(path, rows, headers):
     with open(path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=headers)
         writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+        writer.writerows(rows)
 
 
 def main():
@@ -257,20 +342,26 @@ def main():
     montijo_path = 'sample_files/models/VGP-Montijo-009.osm'
     r2f_path = 'sample_files/models/R2F-Office-Hub-006.osm'
 
-    print('Parsing Montijo OSM...')
-    montijo_rows = parse_montijo(montijo_path)
+    # the two parsers are independent and CPU-bound on different files, so
+    # run them in parallel worker processes and keep the cheap write-out serial
+    logger.info('Parsing Montijo OSM and R2F lighting...')
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        montijo_future = executor.submit(parse_montijo, montijo_path)
+        r2f_future = executor.submit(parse_r2f_lighting, r2f_path)
+        montijo_rows = montijo_future.result()
+        r2f_results = r2f_future.result()
+
     write_json('outputs/vgp_montijo_thermal_zones.json', montijo_rows)
     # write CSV with selected fields
     csv_rows = [{'zone_handle': r['zone_handle'], 'zone_name': r['zone_name'], 'thermostat': r['thermostat'], 'floor_area_m2': r['floor_area_m2'], 'volume_m3': r['volume_m3'], 'n_spaces': r['n_spaces']} for r in montijo_rows]
     write_csv('outputs/vgp_montijo_thermal_zones.csv', csv_rows, ['zone_handle','zone_name','thermostat','floor_area_m2','volume_m3','n_spaces'])
-    print('Wrote outputs/vgp_montijo_thermal_zones.json and .csv')
+    logger.info('Wrote outputs/vgp_montijo_thermal_zones.json and .csv')
 
-    print('Parsing R2F lighting...')
-    r2f_results = parse_r2f_lighting(r2f_path)
     top10 = r2f_results[:10]
     write_csv('outputs/r2f_top_lighting_w_per_m2.csv', top10, ['space_handle','space_name','floor_area_m2','lighting_w_total','lighting_w_per_m2'])
-    print('Wrote outputs/r2f_top_lighting_w_per_m2.csv')
+    logger.info('Wrote outputs/r2f_top_lighting_w_per_m2.csv')
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     main()
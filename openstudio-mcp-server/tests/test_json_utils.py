@@ -0,0 +1,121 @@
+"""
+Tests for JSON response serialization utilities.
+
+Checks in the round-trip verifications previously only described in
+commit messages:
+1. maybe_compress_response: the gzip+base64 envelope decodes back to the
+   original payload, and under-threshold payloads pass through untouched
+2. stream_list_response: the incrementally built output parses to the
+   same object as serializing the whole response dict
+"""
+
+import base64
+import gzip
+import json
+
+import pytest
+
+from openstudio_mcp_server.utils import json_utils
+from openstudio_mcp_server.utils.json_stream import stream_list_response
+
+
+def _sample_list_response(n_records=50):
+    return {
+        "status": "success",
+        "count": n_records,
+        "spaces": [
+            {"Handle": f"{{00000000-0000-0000-0000-{i:012d}}}",
+             "Name": f"Space {i}",
+             "Floor Area {m2}": i * 1.5}
+            for i in range(n_records)
+        ],
+    }
+
+
+def test_under_threshold_passes_through(monkeypatch):
+    """
+    Verify payloads at or under the threshold are returned unchanged.
+    """
+    monkeypatch.setattr(json_utils, "COMPRESS_THRESHOLD", 512000)
+    payload = json_utils._dumps(_sample_list_response(), indent=False)
+    assert json_utils.maybe_compress_response(payload) is payload
+
+
+def test_compression_disabled_by_zero_threshold(monkeypatch):
+    """
+    Verify a threshold of 0 disables the envelope entirely.
+    """
+    monkeypatch.setattr(json_utils, "COMPRESS_THRESHOLD", 0)
+    payload = json_utils._dumps(_sample_list_response(500), indent=False)
+    assert json_utils.maybe_compress_response(payload) is payload
+
+
+def test_oversize_payload_round_trips(monkeypatch):
+    """
+    Verify the gzip+base64 envelope decodes back to the exact payload.
+    """
+    monkeypatch.setattr(json_utils, "COMPRESS_THRESHOLD", 100)
+    payload = json_utils._dumps(_sample_list_response(), indent=False)
+
+    wrapped = json_utils.maybe_compress_response(payload)
+    envelope = json.loads(wrapped)
+
+    assert envelope["status"] == "success"
+    assert envelope["encoding"] == "gzip+base64"
+    decoded = gzip.decompress(base64.b64decode(envelope["payload"])).decode()
+    assert decoded == payload
+
+
+def test_stream_list_response_matches_whole_dict(monkeypatch):
+    """
+    Verify incremental serialization equals serializing the dict whole.
+    """
+    monkeypatch.setattr(json_utils, "COMPRESS_THRESHOLD", 512000)
+    result = _sample_list_response()
+
+    streamed = stream_list_response(result, "spaces")
+
+    assert json.loads(streamed) == json.loads(
+        json_utils._dumps(result, indent=False))
+
+
+def test_stream_list_response_empty_list(monkeypatch):
+    """
+    Verify a zero-record response streams to valid, equivalent JSON.
+    """
+    monkeypatch.setattr(json_utils, "COMPRESS_THRESHOLD", 512000)
+    result = {"status": "success", "count": 0, "spaces": []}
+
+    assert json.loads(stream_list_response(result, "spaces")) == result
+
+
+def test_stream_list_response_compresses_oversize(monkeypatch):
+    """
+    Verify streamed output also goes through the compression envelope.
+    """
+    monkeypatch.setattr(json_utils, "COMPRESS_THRESHOLD", 100)
+    result = _sample_list_response()
+
+    envelope = json.loads(stream_list_response(result, "spaces"))
+
+    assert envelope["encoding"] == "gzip+base64"
+    decoded = gzip.decompress(
+        base64.b64decode(envelope["payload"])).decode()
+    assert json.loads(decoded) == result
+
+
+def test_non_str_dict_keys_serialize_like_stdlib():
+    """
+    Verify non-str dict keys are coerced, not turned into an error reply.
+
+    stdlib json.dumps silently coerces int keys to strings; the orjson
+    path must do the same (OPT_NON_STR_KEYS) so the tolerant
+    ensure_json_response contract holds whichever serializer is active.
+    """
+    result = {"status": "success", "counts_by_zone": {1: 10, 2: 20}}
+
+    serialized = json_utils.ensure_json_response(result)
+
+    parsed = json.loads(serialized)
+    assert parsed["status"] == "success"
+    assert parsed["counts_by_zone"] == {"1": 10, "2": 20}
@@ -0,0 +1,114 @@
+"""
+Tests for the deserialize-once model cache in OpenStudioManager.
+
+Pins the Bug 2 guarantee ("no stale data") for the cache added around
+load_osm_file:
+1. A byte-identical, unchanged file hits the cache (the loader runs once)
+2. A modified file (new mtime/size) misses the cache and is re-read
+3. Cache hits hand out clones, so mutating current_model never leaks
+   into the cached pristine copy
+"""
+
+import pytest
+
+
+class FakeModel:
+    """Stand-in for an OpenStudio model: clonable and mutable."""
+
+    def __init__(self, content):
+        self.content = content
+
+    def clone(self, keep_handles=False):
+        return _FakeCloneResult(FakeModel(self.content))
+
+
+class _FakeCloneResult:
+    """Mimics Workspace.clone(): the copy comes back via to_Model()."""
+
+    def __init__(self, model):
+        self._model = model
+
+    def to_Model(self):
+        return self._model
+
+
+@pytest.fixture
+def manager():
+    from openstudio_mcp_server import get_config, OpenStudioManager
+    return OpenStudioManager(get_config())
+
+
+@pytest.fixture
+def fake_loader(monkeypatch):
+    """Replace the toolkit loader with one that records every disk read."""
+    calls = []
+
+    def load(osm_file_path, version_translator=True):
+        with open(osm_file_path, encoding="utf-8") as f:
+            content = f.read()
+        calls.append(osm_file_path)
+        return FakeModel(content)
+
+    monkeypatch.setattr(
+        "openstudio_toolkit.utils.osm_utils.load_osm_file_as_model", load)
+    return calls
+
+
+def test_unchanged_file_hits_cache(tmp_path, manager, fake_loader):
+    """
+    Verify reloading an unchanged file reuses the cached parse.
+    """
+    osm = tmp_path / "model.osm"
+    osm.write_text("OS:Version,\n  {3.7.0};")
+
+    result1 = manager.load_osm_file(str(osm))
+    result2 = manager.load_osm_file(str(osm))
+
+    assert result1["status"] == "success"
+    assert result2["status"] == "success"
+    assert len(fake_loader) == 1, "Unchanged file should be parsed once"
+    assert manager.current_model.content == "OS:Version,\n  {3.7.0};"
+
+
+def test_modified_file_misses_cache(tmp_path, manager, fake_loader):
+    """
+    Verify a file overwritten on disk is re-read, never served stale.
+
+    This is the Bug 2 guarantee: the cache key includes mtime_ns and
+    size, so new bytes at the same path always miss.
+    """
+    osm = tmp_path / "model.osm"
+    osm.write_text("OS:Version,\n  {3.7.0};\n! first version")
+
+    manager.load_osm_file(str(osm))
+    first_content = manager.current_model.content
+
+    osm.write_text("OS:Version,\n  {3.7.0};\n! second version, now longer")
+    manager.load_osm_file(str(osm))
+
+    assert len(fake_loader) == 2, "Modified file must be re-read from disk"
+    assert manager.current_model.content != first_content
+    assert "second version" in manager.current_model.content
+
+
+def test_mutations_never_leak_into_cache(tmp_path, manager, fake_loader):
+    """
+    Verify cache hits hand out clones isolated from current_model.
+
+    Mutating the served model and reloading the unchanged file must give
+    back the pristine content, from the cache, without a disk read.
+    """
+    osm = tmp_path / "model.osm"
+    osm.write_text("OS:Version,\n  {3.7.0};")
+
+    manager.load_osm_file(str(osm))
+    served_first = manager.current_model
+    served_first.content = "MUTATED IN MEMORY"
+
+    manager.load_osm_file(str(osm))
+
+    assert len(fake_loader) == 1, "Reload of unchanged file should hit cache"
+    assert manager.current_model is not served_first, \
+        "Each load must serve a distinct clone"
+    assert manager.current_model.content == "OS:Version,\n  {3.7.0};", \
+        "Cached copy must stay pristine after a mutation of the served model"
@@ -0,0 +1,146 @@
+"""
+Tests for the OSM text parser in scripts/parse_and_export.py.
+
+Pins the behavior of the mmap+regex tokenizer that replaced the original
+line-by-line parser:
+1. Object counts on the in-tree sample models
+2. Object shape (handle/name fields, vertex lines kept whole)
+3. The `types` / `type_prefixes` filters, including the OS:Thermostat
+   prefix family the Montijo parser depends on
+"""
+
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import parse_and_export  # noqa: E402
+
+MONTIJO_OSM = str(REPO_ROOT / "sample_files" / "models" / "VGP-Montijo-009.osm")
+R2F_OSM = str(REPO_ROOT / "sample_files" / "models" / "R2F-Office-Hub-006.osm")
+
+
+def test_sample_model_object_counts():
+    """
+    Verify object counts on both sample models match the known baseline.
+
+    These numbers were produced by the original line-by-line parser; the
+    tokenizer must reproduce them exactly.
+    """
+    counts = Counter(t for t, _ in parse_and_export.iter_objects(MONTIJO_OSM))
+    assert sum(counts.values()) == 4665
+    assert len(counts) == 111
+    assert counts["OS:Space"] == 53
+    assert counts["OS:ThermalZone"] == 53
+    assert counts["OS:ThermostatSetpoint:DualSetpoint"] == 85
+
+    counts = Counter(t for t, _ in parse_and_export.iter_objects(R2F_OSM))
+    assert sum(counts.values()) == 3095
+    assert len(counts) == 114
+    assert counts["OS:Space"] == 36
+    assert counts["OS:Lights"] == 43
+    assert counts["OS:Lights:Definition"] == 43
+
+
+def test_object_shape_handle_and_name():
+    """
+    Verify each parsed object is (type_name, values) with the handle first.
+
+    Every OS:* object in these files starts with a {uuid} handle field;
+    spaces additionally carry a non-empty name in the second field.
+    """
+    for type_name, values in parse_and_export.iter_objects(MONTIJO_OSM):
+        assert type_name.startswith("OS:")
+        assert isinstance(values, list)
+        if not values:
+            continue
+        handle = values[0]
+        assert handle.startswith("{") and handle.endswith("}"), \
+            f"{type_name} first field should be a handle, got: {handle!r}"
+        if type_name == "OS:Space":
+            assert len(values) >= 2 and values[1], "Space should have a name"
+
+
+def test_vertex_lines_keep_embedded_commas():
+    """
+    Verify surface vertex lines stay one value (commas are not split).
+
+    A vertex field like '0.0, 1.5, 3.0' must survive as a single token;
+    splitting it would shift every later field index.
+    """
+    for type_name, values in parse_and_export.iter_objects(
+            MONTIJO_OSM, types={"OS:Surface"}):
+        vertex_values = [v for v in values if v.count(",") >= 2]
+        assert vertex_values, "Surface should carry at least one vertex line"
+        break
+    else:
+        raise AssertionError("No OS:Surface objects found in sample model")
+
+
+def test_types_filter_excludes_other_types():
+    """
+    Verify the `types` filter returns exactly the requested types.
+    """
+    by_type = parse_and_export.objects_by_type(
+        MONTIJO_OSM, types={"OS:Space", "OS:ThermalZone"})
+    assert set(by_type) == {"OS:Space", "OS:ThermalZone"}
+    assert len(by_type["OS:Space"]) == 53
+    assert len(by_type["OS:ThermalZone"]) == 53
+
+
+def test_type_prefixes_keep_whole_families():
+    """
+    Verify `type_prefixes` keeps every type in the family alongside `types`.
+
+    This pins the chunk8-21 fix: the Montijo parser filters on the
+    ('OS:Thermostat',) prefix so no OS:Thermostat* flavour is dropped.
+    """
+    by_type = parse_and_export.objects_by_type(
+        MONTIJO_OSM,
+        types={"OS:ThermalZone"},
+        type_prefixes=("OS:Thermostat",))
+    assert "OS:ThermalZone" in by_type
+    thermostat_types = [t for t in by_type if t.startswith("OS:Thermostat")]
+    assert thermostat_types, "Prefix filter should keep OS:Thermostat* types"
+    assert sum(len(by_type[t]) for t in thermostat_types) == 85
+    assert all(t == "OS:ThermalZone" or t.startswith("OS:Thermostat")
+               for t in by_type)
+
+
+def test_unfiltered_matches_filtered_subset():
+    """
+    Verify filtering only drops types; it never changes parsed values.
+    """
+    all_spaces = [v for t, v in parse_and_export.iter_objects(R2F_OSM)
+                  if t == "OS:Space"]
+    filtered_spaces = [v for t, v in parse_and_export.iter_objects(
+        R2F_OSM, types={"OS:Space"})]
+    assert filtered_spaces == all_spaces
+
+
+def test_empty_file_yields_nothing(tmp_path):
+    """
+    Verify an empty file parses to zero objects instead of raising.
+    """
+    empty = tmp_path / "empty.osm"
+    empty.write_text("")
+    assert list(parse_and_export.iter_objects(str(empty))) == []
+
+
+def test_comments_are_stripped(tmp_path):
+    """
+    Verify '!' comments do not leak into parsed values.
+    """
+    osm = tmp_path / "commented.osm"
+    osm.write_text(
+        "OS:Building,  ! the building object\n"
+        "  {11111111-2222-3333-4444-555555555555},  ! handle\n"
+        "  Test Building;  ! name\n"
+    )
+    objects = list(parse_and_export.iter_objects(str(osm)))
+    assert objects == [("OS:Building",
+                        ["{11111111-2222-3333-4444-555555555555}",
+                         "Test Building"])]
@@ -0,0 +1,140 @@
+"""
+Tests for the read-only tool response cache in server.py.
+
+Pins the invariants of cached_tool / _invalidate_tool_cache:
+1. Hits on repeated (tool, args) for the same model state
+2. Per-args keying (different args are different entries)
+3. Misses after an epoch bump (model-mutating tool ran)
+4. Misses after the model file's mtime changes on disk
+5. LRU bound: the cache never grows past _tool_cache_size
+6. No caching at all while no model is loaded
+"""
+
+import asyncio
+import os
+
+import pytest
+
+
+@pytest.fixture
+def server(tmp_path):
+    """The server module with an isolated cache and a fake loaded model."""
+    from openstudio_mcp_server import server as srv
+
+    model_file = tmp_path / "model.osm"
+    model_file.write_text("OS:Version,\n  {3.7.0};")
+
+    saved_path = srv.os_manager.current_file_path
+    srv._tool_cache.clear()
+    srv.os_manager.current_file_path = str(model_file)
+    try:
+        yield srv
+    finally:
+        srv.os_manager.current_file_path = saved_path
+        srv._tool_cache.clear()
+
+
+def _make_tool(server, calls):
+    """A minimal cached tool that records every real invocation."""
+
+    @server.cached_tool
+    async def sample_tool(name):
+        calls.append(name)
+        return f"response:{name}:{len(calls)}"
+
+    return sample_tool
+
+
+def test_repeated_call_hits_cache(server):
+    """
+    Verify the same (tool, args) is computed once per model state.
+    """
+    calls = []
+    tool = _make_tool(server, calls)
+
+    first = asyncio.run(tool("Space 1"))
+    second = asyncio.run(tool("Space 1"))
+
+    assert first == second
+    assert calls == ["Space 1"], "Second call should be served from cache"
+
+
+def test_different_args_are_different_entries(server):
+    """
+    Verify args are part of the key: per-name detail calls don't collide.
+    """
+    calls = []
+    tool = _make_tool(server, calls)
+
+    first = asyncio.run(tool("Space 1"))
+    second = asyncio.run(tool("Space 2"))
+
+    assert first != second
+    assert calls == ["Space 1", "Space 2"]
+
+
+def test_epoch_bump_invalidates(server):
+    """
+    Verify a model-mutating tool's epoch bump forces recomputation.
+    """
+    calls = []
+    tool = _make_tool(server, calls)
+
+    asyncio.run(tool("Space 1"))
+    server._invalidate_tool_cache()
+    asyncio.run(tool("Space 1"))
+
+    assert calls == ["Space 1", "Space 1"], \
+        "Epoch bump must invalidate cached responses"
+
+
+def test_mtime_change_invalidates(server):
+    """
+    Verify a file rewritten on disk (new mtime) misses the cache.
+    """
+    calls = []
+    tool = _make_tool(server, calls)
+
+    asyncio.run(tool("Space 1"))
+    path = server.os_manager.current_file_path
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    asyncio.run(tool("Space 1"))
+
+    assert calls == ["Space 1", "Space 1"], \
+        "An mtime change must invalidate cached responses"
+
+
+def test_cache_is_lru_bounded(server, monkeypatch):
+    """
+    Verify the cache evicts least-recently-used entries past the cap.
+    """
+    calls = []
+    tool = _make_tool(server, calls)
+    monkeypatch.setattr(server, "_tool_cache_size", 2)
+
+    asyncio.run(tool("Space 1"))
+    asyncio.run(tool("Space 2"))
+    asyncio.run(tool("Space 1"))  # refresh Space 1: Space 2 is now LRU
+    asyncio.run(tool("Space 3"))  # evicts Space 2
+
+    assert len(server._tool_cache) == 2
+    asyncio.run(tool("Space 1"))
+    assert calls.count("Space 1") == 1, "Space 1 should still be cached"
+    asyncio.run(tool("Space 2"))
+    assert calls.count("Space 2") == 2, "Space 2 should have been evicted"
+
+
+def test_no_caching_without_loaded_model(server):
+    """
+    Verify nothing is cached while no model is loaded.
+    """
+    calls = []
+    tool = _make_tool(server, calls)
+    server.os_manager.current_file_path = None
+
+    asyncio.run(tool("Space 1"))
+    asyncio.run(tool("Space 1"))
+
+    assert calls == ["Space 1", "Space 1"]
+    assert not server._tool_cache